@@ -2,10 +2,17 @@
 # Dash app for Final Assignment - Part 2
 # Uses ONLY the hosted CSV; no local file is required.
 
+import os
+
 import pandas as pd
 import numpy as np
-from dash import Dash, html, dcc, Input, Output, callback
-import plotly.express as px
+from dash import Dash, html, dcc, Input, Output, ClientsideFunction, callback
+import plotly.graph_objects as go
+
+try:
+    import numbagg  # optional accelerator for grouped reductions
+except ImportError:
+    numbagg = None
 
 # ---------------------------------------------------------------------
 # 1) Data: load once from the hosted URL
@@ -14,32 +21,336 @@ URL = ("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/"
        "IBMDeveloperSkillsNetwork-DV0101EN-SkillsNetwork/Data%20Files/"
        "historical_automobile_sales.csv")
 
-df = pd.read_csv(URL)
+# Parsed copy of the CSV as Arrow IPC: reading it back is near-memcpy,
+# so process restarts (debug=True reloads many times) skip both the S3
+# download and the CSV parse. Dtypes round-trip, so the cached frame is
+# already cleaned and the cast passes only run on a cache miss. The
+# version tag in the filename changes whenever the cleaned schema does,
+# and _cache_ok double-checks the contents, so cache files written by
+# older revisions are ignored rather than silently undoing the typing.
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "historical_automobile_sales.v2.feather")
+
+_COLUMNS = ["Year", "Month", "Recession", "Automobile_Sales",
+            "Vehicle_Type", "Advertising_Expenditure", "unemployment_rate"]
+_MONTH_CATS = [str(i) for i in range(1, 13)]
+
+def _cache_ok(cached):
+    """True when `cached` matches the schema _load_data writes today.
+
+    A cache from an earlier revision (extra columns, string Month,
+    nullable Year) reads back fine but would quietly undo the typing
+    work below — e.g. a plain-string Month charts months in lexical
+    order (1, 10, 11, 12, 2, ...) on the monthly line chart.
+    """
+    if sorted(cached.columns) != sorted(_COLUMNS):
+        return False
+    month = cached["Month"].dtype
+    if not isinstance(month, pd.CategoricalDtype):
+        return False
+    if all(str(c).isdigit() for c in month.categories) and not (
+            month.ordered and list(month.categories) == _MONTH_CATS):
+        return False
+    return (cached["Year"].dtype == "int16"
+            and cached["Recession"].dtype == "Int8"
+            and isinstance(cached["Vehicle_Type"].dtype, pd.CategoricalDtype)
+            and all(cached[c].dtype == "float32"
+                    for c in ("Automobile_Sales", "Advertising_Expenditure",
+                              "unemployment_rate")))
+
+def _load_data():
+    if os.path.exists(CACHE_PATH):
+        try:
+            cached = pd.read_feather(CACHE_PATH)
+            if _cache_ok(cached):
+                return cached
+        except Exception:
+            pass  # unreadable cache; fall through to the URL
+
+    # Typed parse: read_csv assigns the target dtypes in its single pass
+    # over each column, instead of object columns followed by a
+    # to_numeric(errors="coerce") pass and a second allocation per column.
+    # float32 halves the bytes the grouped reductions move through the
+    # memory hierarchy; the sums involved stay well within its precision.
+    # usecols keeps only the columns the dashboard references, shrinking
+    # the resident frame — and fails loudly if the source schema drifts,
+    # which beats silently charting fallback zeros.
+    df = pd.read_csv(URL, usecols=_COLUMNS, dtype={
+        "Year": "Int64",
+        "Recession": "Int8",
+        "Vehicle_Type": "category",
+        "Month": "category",
+        "Automobile_Sales": "float32",
+        "Advertising_Expenditure": "float32",
+        "unemployment_rate": "float32",
+    })
+    df["Recession"] = df["Recession"].fillna(0)
+
+    # Rows without a Year are unusable by either report; dropping them
+    # up front lets Year live as plain int16 (years fit easily) instead
+    # of nullable Int64, so Year-keyed grouping skips the masked-array
+    # code paths and the column shrinks 4x.
+    df = df.dropna(subset=["Year"])
+    df["Year"] = df["Year"].astype("int16")
+
+    # Make Month an ordered (1..12) categorical so sorting follows
+    # calendar order via the codes.
+    if df["Month"].isin(_MONTH_CATS).all():
+        df["Month"] = pd.Categorical(df["Month"], categories=_MONTH_CATS, ordered=True)
+    else:
+        df["Month"] = df["Month"].astype("category")
+
+    try:
+        df.to_feather(CACHE_PATH)
+    except Exception:
+        pass  # caching is best-effort (e.g. pyarrow missing, read-only dir)
+    return df
+
+df = _load_data()
+
+# Direct graph_objects constructors fed raw arrays. These skip Plotly
+# Express's DataFrame introspection and trace-factory dispatch, which is
+# most of the Python-side cost of building these small figures.
+def _line_fig(x, y, title, x_title):
+    return go.Figure(
+        data=[go.Scatter(x=x.to_numpy(), y=y.to_numpy(), mode="lines")],
+        layout=go.Layout(title=title, xaxis_title=x_title,
+                         yaxis_title="Automobile_Sales"),
+    )
 
-# Basic cleaning / typing
-df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype("Int64")
-df["Month"] = df["Month"].astype(str)
-df["Recession"] = pd.to_numeric(df["Recession"], errors="coerce").fillna(0).astype(int)
+def _bar_fig(x, y, title):
+    return go.Figure(
+        data=[go.Bar(x=x.to_numpy(), y=y.to_numpy())],
+        layout=go.Layout(title=title, xaxis_title="Vehicle_Type",
+                         yaxis_title="Automobile_Sales"),
+    )
 
-# Keep only columns we’ll reference; if any are missing, create safe fallbacks
-for col, default in [
-    ("Automobile_Sales", 0.0),
-    ("Vehicle_Type", "Unknown"),
-    ("Advertising_Expenditure", 0.0),
-    ("unemployment_rate", np.nan),
-]:
-    if col not in df.columns:
-        df[col] = default
+def _pie_fig(labels, values, title):
+    return go.Figure(
+        data=[go.Pie(labels=labels.to_numpy(), values=values.to_numpy())],
+        layout=go.Layout(title=title),
+    )
+
+# A helper for empty-safe charts. The skeleton is built once; each call
+# just patches the title into a shallow copy, and returning a plain dict
+# also skips go.Figure validation when Dash serializes it.
+_EMPTY_TEMPLATE = {
+    "data": [],
+    "layout": {
+        "xaxis": {"visible": False},
+        "yaxis": {"visible": False},
+        "annotations": [{"text": "No data", "x": 0.5, "y": 0.5, "showarrow": False}],
+    },
+}
 
-# A helper for empty-safe charts
 def _empty_fig(title):
-    fig = px.scatter(title=title)
-    fig.update_layout(xaxis={'visible': False}, yaxis={'visible': False},
-                      annotations=[dict(text="No data", x=0.5, y=0.5, showarrow=False)])
+    return {**_EMPTY_TEMPLATE, "layout": {**_EMPTY_TEMPLATE["layout"], "title": title}}
+
+def _fig_dict(fig):
+    return fig if isinstance(fig, dict) else fig.to_dict()
+
+# ---------------------------------------------------------------------
+# 1b) Precomputed aggregates
+# ---------------------------------------------------------------------
+# df never changes after load, so everything the plotting callback needs
+# can be aggregated once here and looked up per interaction instead of
+# re-running groupby/filter on every dropdown change.
+
+def _grouped_frame(frame, key, spec):
+    """Grouped ``mean``/``sum`` reductions of `frame` by `key`.
+
+    `spec` is a list of (value_column, how) pairs. All reductions share
+    one pass of key-code extraction, so adding an output column costs a
+    single sweep over its values rather than a whole extra groupby —
+    factorization is the dominant groupby cost. Dispatches to numbagg's
+    numba-compiled kernels when the package is installed (the JIT
+    compile cost lands here at import, not in a callback); otherwise
+    np.bincount computes the grouped sums in a single C loop over the
+    contiguous arrays, with means as sums over per-group counts.
+    Categorical keys contribute their existing
+    codes, so nothing gets re-factorized, and labels without any rows
+    are dropped, mirroring observed=True.
+    """
+    keys = frame[key]
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        codes = keys.cat.codes.to_numpy()
+        labels = np.asarray(keys.cat.categories)
+    else:
+        codes, labels = pd.factorize(keys, sort=True)
+        codes = np.asarray(codes)
+        labels = np.asarray(labels)
+    valid = codes >= 0  # -1 marks NaN keys
+    all_valid = bool(valid.all())
+    if not all_valid:
+        codes = codes[valid]
+    n = len(labels)
+    observed = np.bincount(codes, minlength=n) > 0
+    data = {key: labels[observed]}
+    for col, how in spec:
+        vals = frame[col].to_numpy()  # native dtype, so float32 reduces as float32
+        if not all_valid:
+            vals = vals[valid]
+        if numbagg is not None:
+            fn = numbagg.group_nanmean if how == "mean" else numbagg.group_nansum
+            out = fn(vals, codes, num_labels=n)
+        else:
+            finite = ~np.isnan(vals)
+            c, v = (codes, vals) if finite.all() else (codes[finite], vals[finite])
+            out = np.bincount(c, weights=v, minlength=n)
+            if how == "mean":
+                with np.errstate(invalid="ignore"):
+                    out = out / np.bincount(c, minlength=n)
+        data[col] = out[observed]
+    return pd.DataFrame(data)
+
+# Recession-only subset (the Recession report is fully static). The
+# flags never change, so the O(N) scan happens exactly once here;
+# downstream only reads, so no defensive .copy() is needed either.
+REC = df.loc[df["Recession"].to_numpy(dtype=bool)]
+REC_U = REC.dropna(subset=["unemployment_rate"])
+
+# Per-year slices, keyed by int year. The year -> row-positions map
+# makes each slice an O(rows-of-year) fancy-index take instead of a
+# whole-frame groupby split, and no slice is copied — everything
+# downstream only reads.
+_year_arr = df["Year"].to_numpy(dtype="float64", na_value=np.nan)
+YEAR_POS = {int(y): np.flatnonzero(_year_arr == y)
+            for y in np.unique(_year_arr[~np.isnan(_year_arr)])}
+BY_YEAR = {y: df.iloc[pos] for y, pos in YEAR_POS.items()}
+
+def _rec_scatter_fig():
+    # The recession scatter is fully static, so build it once with one
+    # go.Scattergl (WebGL) trace per vehicle type: GPU point rendering
+    # in the browser instead of SVG, and no pandas work per interaction.
+    if REC_U.empty:
+        return None
+    fig = go.Figure(layout=go.Layout(
+        title="Unemployment vs Automobile Sales by Vehicle Type (Recession)",
+        xaxis_title="Unemployment Rate", yaxis_title="Automobile Sales",
+    ))
+    max_sales = float(REC_U["Automobile_Sales"].max()) or 1.0
+    for vt, vsub in REC_U.groupby("Vehicle_Type", observed=True):
+        sales = vsub["Automobile_Sales"].to_numpy()
+        fig.add_trace(go.Scattergl(
+            x=vsub["unemployment_rate"].to_numpy(), y=sales,
+            mode="markers", name=str(vt),
+            marker=dict(size=np.sqrt(sales / max_sales) * 20.0),
+            customdata=np.column_stack([vsub["Year"].to_numpy(),
+                                        vsub["Month"].to_numpy()]),
+            hovertemplate=("Unemployment Rate=%{x}<br>Automobile Sales=%{y}"
+                           "<br>Year=%{customdata[0]}<br>Month=%{customdata[1]}"
+                           "<extra>" + str(vt) + "</extra>"),
+        ))
     return fig
 
+def _monthly_tables():
+    # _grouped_frame emits labels in category order, which for the
+    # ordered 1..12 Month categorical set at load time is calendar
+    # order already — no int-cast/sort pass needed.
+    return {y: _grouped_frame(sub, "Month", [("Automobile_Sales", "sum")])
+            for y, sub in BY_YEAR.items()}
+
+def _type_agg_tables():
+    # Mean sales and summed ad spend per type share one grouping pass
+    return {y: _grouped_frame(sub, "Vehicle_Type",
+                              [("Automobile_Sales", "mean"),
+                               ("Advertising_Expenditure", "sum")])
+            for y, sub in BY_YEAR.items()}
+
+# The precompute runs sequentially on the main thread. It is only a
+# couple of seconds of one-time startup work, and numba-backed kernels
+# (numbagg) must not be first-invoked from worker threads: the threading
+# layer then deadlocks interpreter teardown, hanging the debug reloader,
+# Ctrl-C and gunicorn worker recycling.
+
+# Whole-period yearly average (fig1 of the Yearly report)
+YEARLY_MEAN = _grouped_frame(df, "Year", [("Automobile_Sales", "mean")])
+REC_YEARLY = _grouped_frame(REC, "Year", [("Automobile_Sales", "mean")])
+# Both per-type recession aggregates come out of one grouping pass
+REC_TYPE = _grouped_frame(REC, "Vehicle_Type",
+                          [("Automobile_Sales", "mean"),
+                           ("Advertising_Expenditure", "sum")])
+REC_SCATTER = _rec_scatter_fig()
+MONTHLY = _monthly_tables()
+TYPE_AGG = _type_agg_tables()
+
 # Controls
-years = sorted([int(y) for y in df["Year"].dropna().unique().tolist()])
+years = sorted(BY_YEAR)
+
+# Builds the four figures for one (report_type, year) input as plain
+# dicts. Called once per reachable input below to populate FIGURES;
+# nothing figure-related runs per interaction after that.
+def _build_figures(report_type, year_value):
+    # ---------------------- Yearly Statistics -------------------------
+    if report_type == "Yearly Statistics":
+        # 1) Yearly automobile sales (whole period) – line chart
+        if YEARLY_MEAN.empty:
+            fig1 = _empty_fig("Yearly Automobile Sales (Average)")
+        else:
+            fig1 = _line_fig(YEARLY_MEAN["Year"], YEARLY_MEAN["Automobile_Sales"],
+                             "Yearly Automobile Sales (Average over Months)",
+                             "Year")
+
+        # 2) Total monthly sales for selected year – line chart
+        monthly = MONTHLY.get(year_value)
+        fig2 = (_empty_fig(f"Total Monthly Automobile Sales — {year_value}")
+                if monthly is None or monthly.empty else
+                _line_fig(monthly["Month"], monthly["Automobile_Sales"],
+                          f"Total Monthly Automobile Sales — {year_value}",
+                          "Month"))
+
+        # 3) Average vehicles sold by vehicle type (selected year) – bar
+        # 4) Total advertisement expenditure for each vehicle type (selected year) – pie
+        by_type = TYPE_AGG.get(year_value)
+        if by_type is None or by_type.empty:
+            fig3 = _empty_fig(f"Average Vehicles Sold by Vehicle Type — {year_value}")
+            fig4 = _empty_fig(f"Ad Expenditure Share by Vehicle Type — {year_value}")
+        else:
+            fig3 = _bar_fig(by_type["Vehicle_Type"], by_type["Automobile_Sales"],
+                            f"Average Vehicles Sold by Vehicle Type — {year_value}")
+            fig4 = _pie_fig(by_type["Vehicle_Type"], by_type["Advertising_Expenditure"],
+                            f"Ad Expenditure Share by Vehicle Type — {year_value}")
+        return _fig_dict(fig1), _fig_dict(fig2), _fig_dict(fig3), _fig_dict(fig4)
+
+    # ------------------ Recession Period Statistics -------------------
+
+    # 1) Average sales fluctuation over recession years – line
+    fig1 = (_empty_fig("Avg Automobile Sales during Recession (Year-wise)")
+            if REC_YEARLY.empty else
+            _line_fig(REC_YEARLY["Year"], REC_YEARLY["Automobile_Sales"],
+                      "Avg Automobile Sales during Recession (Year-wise)",
+                      "Year"))
+
+    # 2) Average number of vehicles sold by vehicle type during recessions – bar
+    fig2 = (_empty_fig("Avg Vehicles Sold by Vehicle Type (Recession)")
+            if REC_TYPE.empty else
+            _bar_fig(REC_TYPE["Vehicle_Type"], REC_TYPE["Automobile_Sales"],
+                     "Avg Vehicles Sold by Vehicle Type (Recession)"))
+
+    # 3) Advertising expenditure share by vehicle type during recessions – pie
+    fig3 = (_empty_fig("Ad Expenditure Share by Vehicle Type (Recession)")
+            if REC_TYPE.empty else
+            _pie_fig(REC_TYPE["Vehicle_Type"], REC_TYPE["Advertising_Expenditure"],
+                     "Ad Expenditure Share by Vehicle Type (Recession)"))
+
+    # 4) Effect of unemployment rate on vehicle type and sales (Recession)
+    #    A scatter with size ~ sales, color = type, x=unemployment_rate, y=sales
+    fig4 = (_empty_fig("Unemployment vs Sales (Recession)")
+            if REC_SCATTER is None else REC_SCATTER)
+
+    return _fig_dict(fig1), _fig_dict(fig2), _fig_dict(fig3), _fig_dict(fig4)
+
+# Every reachable figure, prebuilt: the input space is just one state
+# per year plus a single Recession state. Year keys are strings to
+# match what JSON serialization hands the clientside callback.
+FIGURES = {
+    "Yearly Statistics": {
+        str(y): list(_build_figures("Yearly Statistics", y)) for y in years
+    },
+    "Recession Period Statistics": list(
+        _build_figures("Recession Period Statistics", None)
+    ),
+}
 
 # ---------------------------------------------------------------------
 # 2) App & Layout
@@ -47,6 +358,11 @@ years = sorted([int(y) for y in df["Year"].dropna().unique().tolist()])
 app = Dash(__name__, suppress_callback_exceptions=True)
 app.title = "Automobile Sales Dashboard"
 
+# WSGI entry point so production runs get real concurrency instead of
+# the single-threaded Werkzeug dev server, e.g.:
+#   gunicorn -w 4 -k gevent Part2_dashboard:server
+server = app.server
+
 controls = html.Div(
     [
         html.H2("Controls"),
@@ -98,6 +414,9 @@ grid = html.Div(
 
 app.layout = html.Div(
     [
+        # Prebuilt figure JSON shipped to the browser once; the
+        # clientside callback below indexes into it per interaction.
+        dcc.Store(id="fig-cache", data=FIGURES, storage_type="memory"),
         html.H1("Automobile Sales Dashboard", style={"textAlign": "center"}),
         html.Div([controls, grid], style={"display": "flex", "gap": "16px"}),
     ],
@@ -119,112 +438,26 @@ def toggle_year_dropdown(report_type):
         return False, "Year is enabled for Yearly Statistics."
     return True, "Year is disabled for Recession Period Statistics."
 
-# Main plotting callback (returns 4 figures)
-@callback(
+# Figure selection runs clientside (assets/figures.js): every reachable
+# figure already sits in the fig-cache Store, so a dropdown change is a
+# dict lookup in the browser — no HTTP round-trip and no server-side
+# JSON encoding per interaction.
+app.clientside_callback(
+    ClientsideFunction(namespace="figure_cache", function_name="pick"),
     Output("fig-1", "figure"),
     Output("fig-2", "figure"),
     Output("fig-3", "figure"),
     Output("fig-4", "figure"),
     Input("report-dd", "value"),
     Input("year-dd", "value"),
+    Input("fig-cache", "data"),
 )
-def update_charts(report_type, year_value):
-    # Defensive: if no year is selected yet (first render), pick last one
-    if year_value is None and years:
-        year_value = years[-1]
-
-    # ---------------------- Yearly Statistics -------------------------
-    if report_type == "Yearly Statistics":
-        # 1) Yearly automobile sales (whole period) – line chart
-        yearly = (df.groupby("Year", as_index=False)["Automobile_Sales"]
-                    .mean(numeric_only=True))
-        if yearly.empty:
-            fig1 = _empty_fig("Yearly Automobile Sales (Average)")
-        else:
-            fig1 = px.line(yearly, x="Year", y="Automobile_Sales",
-                           title="Yearly Automobile Sales (Average over Months)")
-
-        # Data for selected year
-        dff = df[df["Year"] == year_value].copy()
-
-        # 2) Total monthly sales for selected year – line chart
-        monthly = (dff.groupby("Month", as_index=False)["Automobile_Sales"]
-                     .sum(numeric_only=True))
-        # preserve month order if the CSV provides numeric months
-        try:
-            monthly["Month_num"] = monthly["Month"].astype(int)
-            monthly = monthly.sort_values("Month_num")
-        except Exception:
-            pass
-
-        fig2 = (_empty_fig(f"Total Monthly Automobile Sales — {year_value}")
-                if monthly.empty else
-                px.line(monthly, x="Month", y="Automobile_Sales",
-                        title=f"Total Monthly Automobile Sales — {year_value}"))
-
-        # 3) Average vehicles sold by vehicle type (selected year) – bar
-        by_type = (dff.groupby("Vehicle_Type", as_index=False)["Automobile_Sales"]
-                     .mean(numeric_only=True))
-        fig3 = (_empty_fig(f"Average Vehicles Sold by Vehicle Type — {year_value}")
-                if by_type.empty else
-                px.bar(by_type, x="Vehicle_Type", y="Automobile_Sales",
-                       title=f"Average Vehicles Sold by Vehicle Type — {year_value}"))
-
-        # 4) Total advertisement expenditure for each vehicle type (selected year) – pie
-        adv = (dff.groupby("Vehicle_Type", as_index=False)["Advertising_Expenditure"]
-                 .sum(numeric_only=True))
-        fig4 = (_empty_fig(f"Ad Expenditure Share by Vehicle Type — {year_value}")
-                if adv.empty else
-                px.pie(adv, names="Vehicle_Type", values="Advertising_Expenditure",
-                       title=f"Ad Expenditure Share by Vehicle Type — {year_value}"))
-        return fig1, fig2, fig3, fig4
-
-    # ------------------ Recession Period Statistics -------------------
-    rec = df[df["Recession"] == 1].copy()
-
-    # 1) Average sales fluctuation over recession years – line
-    rec_yearly = (rec.groupby("Year", as_index=False)["Automobile_Sales"]
-                    .mean(numeric_only=True))
-    fig1 = (_empty_fig("Avg Automobile Sales during Recession (Year-wise)")
-            if rec_yearly.empty else
-            px.line(rec_yearly, x="Year", y="Automobile_Sales",
-                    title="Avg Automobile Sales during Recession (Year-wise)"))
-
-    # 2) Average number of vehicles sold by vehicle type during recessions – bar
-    rec_type_avg = (rec.groupby("Vehicle_Type", as_index=False)["Automobile_Sales"]
-                      .mean(numeric_only=True))
-    fig2 = (_empty_fig("Avg Vehicles Sold by Vehicle Type (Recession)")
-            if rec_type_avg.empty else
-            px.bar(rec_type_avg, x="Vehicle_Type", y="Automobile_Sales",
-                   title="Avg Vehicles Sold by Vehicle Type (Recession)"))
-
-    # 3) Advertising expenditure share by vehicle type during recessions – pie
-    rec_adv = (rec.groupby("Vehicle_Type", as_index=False)["Advertising_Expenditure"]
-                 .sum(numeric_only=True))
-    fig3 = (_empty_fig("Ad Expenditure Share by Vehicle Type (Recession)")
-            if rec_adv.empty else
-            px.pie(rec_adv, names="Vehicle_Type", values="Advertising_Expenditure",
-                   title="Ad Expenditure Share by Vehicle Type (Recession)"))
-
-    # 4) Effect of unemployment rate on vehicle type and sales (Recession)
-    #    A scatter with size ~ sales, color = type, x=unemployment_rate, y=sales
-    rec_u = rec.dropna(subset=["unemployment_rate"]).copy()
-    if rec_u.empty:
-        fig4 = _empty_fig("Unemployment vs Sales (Recession)")
-    else:
-        fig4 = px.scatter(
-            rec_u, x="unemployment_rate", y="Automobile_Sales",
-            color="Vehicle_Type", size="Automobile_Sales",
-            title="Unemployment vs Automobile Sales by Vehicle Type (Recession)",
-            hover_data=["Year", "Month"]
-        )
-        fig4.update_layout(xaxis_title="Unemployment Rate", yaxis_title="Automobile Sales")
-
-    return fig1, fig2, fig3, fig4
 
 # ---------------------------------------------------------------------
 # 4) Main
 # ---------------------------------------------------------------------
 if __name__ == "__main__":
+    # Dev server only (debug=True); production should go through the
+    # `server` WSGI object above.
     # Use a port that won’t clash with anything else
     app.run(debug=True, port=8069)
@@ -0,0 +1,22 @@
+// Clientside figure selection for Part2_dashboard.py.
+// Every reachable figure is prebuilt on the server and shipped once via
+// the fig-cache Store; picking the four figures for the current dropdown
+// state is then a plain dict lookup in the browser, with no HTTP
+// round-trip per interaction.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    figure_cache: {
+        pick: function (report, year, cache) {
+            var nu = window.dash_clientside.no_update;
+            if (!cache || !(report in cache)) {
+                return [nu, nu, nu, nu];
+            }
+            var figs = cache[report];
+            if (report === "Yearly Statistics") {
+                // Defensive: on first render year may still be null.
+                var keys = Object.keys(figs);
+                figs = figs[String(year)] || figs[keys[keys.length - 1]];
+            }
+            return figs || [nu, nu, nu, nu];
+        }
+    }
+});